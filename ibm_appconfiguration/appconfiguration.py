@@ -21,17 +21,21 @@ CLI or API to define feature flags or properties, organized into collections and
 Toggle feature flag states in the cloud to activate or deactivate features in your application or environment, when required.
 You can also manage the properties for distributed applications centrally.
 """
-from typing import Dict, Optional
+from __future__ import annotations
+import atexit
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
 from .configurations.internal.utils.validators import Validators
 from .configurations.models import Feature, Property
 from .configurations.internal.utils.logger import Logger
-from .configurations.internal.common import config_messages
+from .configurations.internal.common import config_messages, config_constants
 from .configurations.configuration_handler import ConfigurationHandler
 
 
 class AppConfiguration:
     """ AppConfiguration class"""
     __instance = None
+    __instance_lock = Lock()
 
     # regions
     REGION_US_SOUTH = "us-south"
@@ -43,7 +47,9 @@ class AppConfiguration:
     def get_instance():
         """ Static access method. """
         if AppConfiguration.__instance is None:
-            return AppConfiguration()
+            with AppConfiguration.__instance_lock:
+                if AppConfiguration.__instance is None:
+                    AppConfiguration()
         return AppConfiguration.__instance
 
     @staticmethod
@@ -65,12 +71,19 @@ class AppConfiguration:
         self.__region = ''
         self.__configuration_handler_instance = None
         self.__guid = ''
+        self.__retry_interval = config_constants.DEFAULT_RETRY_INTERVAL
+        self.__max_retry_interval = config_constants.DEFAULT_MAX_RETRY_INTERVAL
         self.__is_initialized = False
         self.__is_initialized_configuration = False
         self.__is_loading = False
+        self.__load_lock = Lock()
+        self.__loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="appconfig-loader")
         AppConfiguration.__instance = self
+        atexit.register(self.__shutdown)
 
-    def init(self, region: str, guid: str, apikey: str):
+    def init(self, region: str, guid: str, apikey: str,
+             retry_interval: float = config_constants.DEFAULT_RETRY_INTERVAL,
+             max_retry_interval: float = config_constants.DEFAULT_MAX_RETRY_INTERVAL):
         """Initialise the AppConfiguration
 
            Args:
@@ -79,6 +92,9 @@ class AppConfiguration:
                Get it from the service credentials section of the dashboard
                apikey : ApiKey of the App Configuration service.\
                Get it from the service credentials section of the dashboard
+               retry_interval : Base delay in seconds before retrying a failed configuration fetch \
+               or socket connection. The delay doubles on every consecutive failure.
+               max_retry_interval : Upper bound in seconds for the retry delay.
         """
 
         if not Validators.validate_string(region):
@@ -90,11 +106,17 @@ class AppConfiguration:
         if not Validators.validate_string(guid):
             Logger.error(config_messages.GUID_ERROR)
             return
+        if not Validators.validate_number(retry_interval) \
+                or not Validators.validate_number(max_retry_interval) \
+                or retry_interval <= 0 or max_retry_interval < retry_interval:
+            Logger.error(config_messages.RETRY_INTERVAL_ERROR)
+            return
         self.__apikey = apikey
         self.__region = region
         self.__guid = guid
+        self.__retry_interval = retry_interval
+        self.__max_retry_interval = max_retry_interval
         self.__is_initialized = True
-        self.__is_loading = False
         self.__setup_configuration_handler()
 
     def get_region(self) -> str:
@@ -122,8 +144,8 @@ class AppConfiguration:
         return self.__apikey
 
     def set_context(self, collection_id: str, environment_id: str,
-                    configuration_file: Optional[str] = None,
-                    live_config_update_enabled: Optional[bool] = True):
+                    configuration_file: str | None = None,
+                    live_config_update_enabled: bool | None = True):
 
         """Set the collection and environment value of the service.
         This method accepts configuration_file and live_config_update_enabled
@@ -163,7 +185,9 @@ class AppConfiguration:
     def fetch_configurations(self):
         """Fetch the latest configurations"""
         if self.__is_initialized and self.__is_initialized_configuration:
-            self.__load_data_now()
+            if not self.__is_loading:
+                future = self.__loader.submit(self.__load_data_now)
+                future.add_done_callback(self.__on_load_done)
         else:
             Logger.error(config_messages.COLLECTION_INIT_ERROR)
 
@@ -172,14 +196,30 @@ class AppConfiguration:
         self.__configuration_handler_instance.init(apikey=self.__apikey,
                                                    guid=self.__guid,
                                                    region=self.__region,
-                                                   override_server_host=self.override_server_host)
+                                                   override_server_host=self.override_server_host,
+                                                   retry_interval=self.__retry_interval,
+                                                   max_retry_interval=self.__max_retry_interval)
 
     def __load_data_now(self):
-        if self.__is_loading:
+        with self.__load_lock:
+            if self.__is_loading:
+                return
+            self.__is_loading = True
+        try:
+            self.__configuration_handler_instance.load_data()
+        finally:
+            with self.__load_lock:
+                self.__is_loading = False
+
+    def __shutdown(self):
+        self.__loader.shutdown(wait=False)
+
+    def __on_load_done(self, future):
+        if future.cancelled():
             return
-        self.__is_loading = True
-        self.__configuration_handler_instance.load_data()
-        self.__is_loading = False
+        exception = future.exception()
+        if exception is not None:
+            Logger.error(f'Error while loading the configurations {exception}')
 
     def register_configuration_update_listener(self, listener):
         """Register a listener for the Configuration changes.
@@ -206,7 +246,7 @@ class AppConfiguration:
         Logger.error(config_messages.COLLECTION_INIT_ERROR)
         return None
 
-    def get_features(self) -> Dict[str, Feature]:
+    def get_features(self) -> dict[str, Feature]:
         """Get the list of Feature objects
 
         Returns:
@@ -217,7 +257,7 @@ class AppConfiguration:
         Logger.error(config_messages.COLLECTION_INIT_ERROR)
         return None
 
-    def get_properties(self) -> Dict[str, Property]:
+    def get_properties(self) -> dict[str, Property]:
         """Get the list of Property objects
 
         Returns:
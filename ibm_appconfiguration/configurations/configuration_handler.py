@@ -15,8 +15,11 @@
 """
 Internal class to handle the configuration.
 """
-from typing import Dict, List, Optional, Any
-from threading import Timer, Thread
+from __future__ import annotations
+import random
+import atexit
+from typing import Any
+from threading import Timer, Thread, Lock
 from ibm_appconfiguration.configurations.internal.common import config_messages, config_constants
 from .internal.utils.logger import Logger
 from .models import Feature
@@ -30,22 +33,31 @@ from .internal.utils.url_builder import URLBuilder
 from .internal.utils.connectivity import Connectivity
 from .internal.utils.api_manager import APIManager
 
+_DEFAULT_RESULT = {
+    'evaluated_segment_id': config_constants.DEFAULT_SEGMENT_ID,
+    'value': None
+}
+
 
 class ConfigurationHandler:
     """Internal class to handle the configuration"""
     __instance = None
+    __instance_lock = Lock()
+    __retry_count = config_constants.DEFAULT_RETRY_COUNT
+    __max_retry_exponent = 32
 
     @staticmethod
     def get_instance():
         """ Static access method. """
         if ConfigurationHandler.__instance is None:
-            return ConfigurationHandler()
+            with ConfigurationHandler.__instance_lock:
+                if ConfigurationHandler.__instance is None:
+                    ConfigurationHandler()
         return ConfigurationHandler.__instance
 
     def __init__(self):
 
         """ Virtually private constructor. """
-        self.__retry_count = 3
         if ConfigurationHandler.__instance is not None:
             raise Exception("ConfigurationHandler " + config_messages.SINGLETON_EXCEPTION)
         self.__collection_id = ''
@@ -58,10 +70,15 @@ class ConfigurationHandler:
         self.__feature_map = dict()
         self.__property_map = dict()
         self.__segment_map = dict()
+        self.__missing_feature_ids = set()
+        self.__missing_property_ids = set()
+        self.__config_cache_time = None
         self.__live_config_update_enabled = True
         ConfigurationHandler.__instance = self
-        self.__retry_count = 3
-        self.__retry_interval = 600
+        self.__retry_interval = config_constants.DEFAULT_RETRY_INTERVAL
+        self.__max_retry_interval = config_constants.DEFAULT_MAX_RETRY_INTERVAL
+        self.__api_retry_attempt = 0
+        self.__socket_retry_attempt = 0
         self.__config_file = None
         self.__on_socket_retry = False
         self.__override_server_host = None
@@ -69,11 +86,19 @@ class ConfigurationHandler:
         self.__connectivity = None
         self.__is_network_connected = True
         self.__api_manager = None
+        self.__is_network_stack_ready = False
+        self.__network_stack_lock = Lock()
+        self.__pending_timers = set()
+        self.__timers_lock = Lock()
+        self.__is_shutdown = False
+        atexit.register(self.__shutdown)
 
     def init(self, apikey: str,
              guid: str,
              region: str,
-             override_server_host=str):
+             override_server_host=str,
+             retry_interval: float = config_constants.DEFAULT_RETRY_INTERVAL,
+             max_retry_interval: float = config_constants.DEFAULT_MAX_RETRY_INTERVAL):
         """ Initialize the configuration.
 
         Args:
@@ -81,20 +106,30 @@ class ConfigurationHandler:
             guid: GUID of the App Configuration service. Get it from the service credentials section of the dashboard
             region: Region name where the service instance is created.
             override_server_host: Non public urls for testing purpose.
+            retry_interval: Base delay in seconds before retrying a failed API call
+                or socket connection.
+            max_retry_interval: Upper bound in seconds for the retry delay.
         """
 
         self.__apikey = apikey
         self.__guid = guid
         self.__region = region
         self.__override_server_host = override_server_host
+        self.__retry_interval = retry_interval
+        self.__max_retry_interval = max_retry_interval
+        self.__api_retry_attempt = 0
+        self.__socket_retry_attempt = 0
 
         self.__feature_map = dict()
         self.__property_map = dict()
         self.__segment_map = dict()
+        self.__missing_feature_ids = set()
+        self.__missing_property_ids = set()
+        self.__config_cache_time = None
 
     def set_context(self, collection_id: str, environment_id: str,
-                    configuration_file: Optional[str] = None,
-                    live_config_update_enabled: Optional[bool] = True):
+                    configuration_file: str | None = None,
+                    live_config_update_enabled: bool | None = True):
         """Set the context for the configuration
 
         Args:
@@ -108,20 +143,29 @@ class ConfigurationHandler:
 
         self.__collection_id = collection_id
         self.__environment_id = environment_id
-        URLBuilder.init_with_collection_id(collection_id=collection_id,
-                                           guid=self.__guid,
-                                           region=self.__region,
-                                           environment_id=environment_id,
-                                           override_server_host=self.__override_server_host,
-                                           apikey=self.__apikey)
-        Metering.get_instance().set_metering_url(URLBuilder.get_metering_url(), self.__apikey)
-        self.__api_manager = APIManager.get_instance()
-        self.__api_manager.setup_base()
+        self.__is_network_stack_ready = False
         self.__is_initialized = True
 
         self.__live_config_update_enabled = live_config_update_enabled
         self.__config_file = configuration_file
-        self.__check_network()
+
+    def __ensure_network_stack(self):
+        if self.__is_network_stack_ready:
+            return
+        with self.__network_stack_lock:
+            if self.__is_network_stack_ready:
+                return
+            URLBuilder.init_with_collection_id(collection_id=self.__collection_id,
+                                               guid=self.__guid,
+                                               region=self.__region,
+                                               environment_id=self.__environment_id,
+                                               override_server_host=self.__override_server_host,
+                                               apikey=self.__apikey)
+            Metering.get_instance().set_metering_url(URLBuilder.get_metering_url(), self.__apikey)
+            self.__api_manager = APIManager.get_instance()
+            self.__api_manager.setup_base()
+            self.__is_network_stack_ready = True
+            self.__check_network()
 
     def load_data(self):
         """Load the configuration data"""
@@ -173,7 +217,7 @@ class ConfigurationHandler:
             Logger.debug(config_messages.NO_INTERNET_CONNECTION_ERROR)
             self.__is_network_connected = False
 
-    def get_properties(self) -> Dict[str, Property]:
+    def get_properties(self) -> dict[str, Property]:
         """Get the list of Property objects
 
         Returns:
@@ -190,15 +234,19 @@ class ConfigurationHandler:
             Property object with the given property_id. If the Property is \
             not available then expect `None`.
         """
-        if property_id in self.__property_map:
-            return self.__property_map.get(property_id)
-        self.__load_configurations()
-        if property_id in self.__property_map:
-            return self.__property_map.get(property_id)
+        property_obj = self.__property_map.get(property_id)
+        if property_obj is not None:
+            return property_obj
+        if property_id not in self.__missing_property_ids:
+            self.__load_configurations()
+            property_obj = self.__property_map.get(property_id)
+            if property_obj is not None:
+                return property_obj
+            self.__missing_property_ids.add(property_id)
         Logger.error(config_messages.PROPERTY_INVALID + property_id)
         return None
 
-    def get_features(self) -> Dict[str, Feature]:
+    def get_features(self) -> dict[str, Feature]:
         """Get the list of Feature objects
 
         Returns:
@@ -215,16 +263,21 @@ class ConfigurationHandler:
             Feature object with the given feature_id. If the Feature is not available \
             then expect `None`.
         """
-        if feature_id in self.__feature_map:
-            return self.__feature_map.get(feature_id)
-        self.__load_configurations()
-        if feature_id in self.__feature_map:
-            return self.__feature_map.get(feature_id)
+        feature = self.__feature_map.get(feature_id)
+        if feature is not None:
+            return feature
+        if feature_id not in self.__missing_feature_ids:
+            self.__load_configurations()
+            feature = self.__feature_map.get(feature_id)
+            if feature is not None:
+                return feature
+            self.__missing_feature_ids.add(feature_id)
         Logger.error(config_messages.FEATURE_INVALID + feature_id)
         return None
 
     def __fetch_config_data(self):
         if self.__is_initialized:
+            self.__ensure_network_stack()
             self.__fetch_from_api()
             self.__on_socket_retry = False
             config_thread = Thread(target=self.__start_web_socket, args=())
@@ -252,39 +305,57 @@ class ConfigurationHandler:
             self.__write_to_file(json=data)
 
     def __load_configurations(self):
+        modified_time = FileManager.get_modified_time()
+        if modified_time is not None and modified_time == self.__config_cache_time:
+            return
         all_config: dict = FileManager.read_files()
         if all_config:
+            self.__config_cache_time = modified_time
+            self.__build_maps(all_config)
+
+    def __build_maps(self, all_config: dict):
+        if all_config:
+            self.__missing_feature_ids = set()
+            self.__missing_property_ids = set()
             if 'features' in all_config:
-                self.__feature_map = dict()
                 try:
-                    all_feature_list: List = all_config.get('features')
-                    for i, feature in enumerate(all_feature_list):
-                        feature_obj = Feature(feature)
-                        self.__feature_map[feature_obj.get_feature_id()] = feature_obj
+                    features = (self.__parse_entry(Feature, feature)
+                                for feature in all_config.get('features'))
+                    self.__feature_map = {feature_obj.get_feature_id(): feature_obj
+                                          for feature_obj in features if feature_obj is not None}
                 except Exception as err:
+                    self.__feature_map = dict()
                     Logger.debug(err)
 
             if 'properties' in all_config:
-                self.__property_map = dict()
                 try:
-                    all_property_list: List = all_config.get('properties')
-                    for i, property_list in enumerate(all_property_list):
-                        property_obj = Property(property_list)
-                        self.__property_map[property_obj.get_property_id()] = property_obj
+                    properties = (self.__parse_entry(Property, property_list)
+                                  for property_list in all_config.get('properties'))
+                    self.__property_map = {property_obj.get_property_id(): property_obj
+                                           for property_obj in properties
+                                           if property_obj is not None}
                 except Exception as err:
+                    self.__property_map = dict()
                     Logger.debug(err)
 
             if 'segments' in all_config:
-                self.__segment_map = dict()
                 try:
-                    segment_list: List = all_config.get('segments')
-                    for i, segment in enumerate(segment_list):
-                        segment: dict = segment_list[i]
-                        segment_obj = Segment(segment)
-                        self.__segment_map[segment_obj.get_segment_id()] = segment_obj
+                    segments = (self.__parse_entry(Segment, segment)
+                                for segment in all_config.get('segments'))
+                    self.__segment_map = {segment_obj.get_segment_id(): segment_obj
+                                          for segment_obj in segments if segment_obj is not None}
                 except Exception as err:
+                    self.__segment_map = dict()
                     Logger.debug(err)
 
+    @staticmethod
+    def __parse_entry(model, entry: dict):
+        try:
+            return model(entry)
+        except Exception as err:
+            Logger.debug(err)
+            return None
+
     def record_valuation(self, property_id, feature_id, entity_id, evaluated_segment_id):
         """Record the evaluation data.
 
@@ -316,10 +387,7 @@ class ConfigurationHandler:
             Return evaluated value
         """
 
-        result_dict = {
-            'evaluated_segment_id': config_constants.DEFAULT_SEGMENT_ID,
-            'value': None
-        }
+        evaluated_segment_id = config_constants.DEFAULT_SEGMENT_ID
 
         try:
             if entity_attributes is None or len(entity_attributes) <= 0:
@@ -327,16 +395,17 @@ class ConfigurationHandler:
 
             segment_rules = property_obj.get_segment_rules()
             if len(segment_rules) > 0:
-                rules_map = self.__parse_rules(segment_rules)
-                result_dict = self.__evaluate_rules(rules_map, entity_attributes,
+                rules_list = self.__parse_rules(segment_rules)
+                result_dict = self.__evaluate_rules(rules_list, entity_attributes,
                                                     property_obj=property_obj)
+                evaluated_segment_id = result_dict['evaluated_segment_id']
                 return result_dict['value']
             return property_obj.get_value()
 
         finally:
             property_id = property_obj.get_property_id()
             self.record_valuation(property_id=property_id, feature_id=None, entity_id=entity_id,
-                                  evaluated_segment_id=result_dict['evaluated_segment_id'])
+                                  evaluated_segment_id=evaluated_segment_id)
 
     def feature_evaluation(self, feature: Feature, entity_id: str,
                            entity_attributes: dict = None) -> Any:
@@ -349,10 +418,7 @@ class ConfigurationHandler:
         Returns:
             Return evaluated value
         """
-        result_dict = {
-            'evaluated_segment_id': config_constants.DEFAULT_SEGMENT_ID,
-            'value': None
-        }
+        evaluated_segment_id = config_constants.DEFAULT_SEGMENT_ID
         try:
             if feature.is_enabled():
 
@@ -361,62 +427,60 @@ class ConfigurationHandler:
 
                 segment_rules = feature.get_segment_rules()
                 if len(segment_rules) > 0:
-                    rules_map = self.__parse_rules(segment_rules)
-                    result_dict = self.__evaluate_rules(rules_map, entity_attributes, feature=feature)
+                    rules_list = self.__parse_rules(segment_rules)
+                    result_dict = self.__evaluate_rules(rules_list, entity_attributes,
+                                                        feature=feature)
+                    evaluated_segment_id = result_dict['evaluated_segment_id']
                     return result_dict['value']
                 return feature.get_enabled_value()
             return feature.get_disabled_value()
         finally:
             feature_id = None if feature is None else feature.get_feature_id()
             self.record_valuation(property_id=None, feature_id=feature_id, entity_id=entity_id,
-                                  evaluated_segment_id=result_dict['evaluated_segment_id'])
+                                  evaluated_segment_id=evaluated_segment_id)
 
-    def __evaluate_rules(self, rules_map: dict,
+    def __evaluate_rules(self, rules_list: list[SegmentRules],
                          entity_attributes: {},
                          feature: Feature = None,
                          property_obj: Property = None) -> dict:
-        result_dict = {
-            'evaluated_segment_id': config_constants.DEFAULT_SEGMENT_ID,
-            'value': None
-        }
-        for i in range(1, len(rules_map) + 1):
-            segment_rule = rules_map[i]
-            if segment_rule is not None:
-                for level in range(0, len(segment_rule.get_rules())):
-                    try:
-                        rule: dict = segment_rule.get_rules()[level]
-                        segments: List = rule.get('segments')
-                        for _, segment_key in enumerate(segments):
-                            if self.__evaluate_segment(segment_key, entity_attributes):
-                                result_dict['evaluated_segment_id'] = segment_key
-                                if segment_rule.get_value() == "$default":
-                                    result_dict[
-                                        'value'] = feature.get_enabled_value() if feature is not \
-                                                                                  None else property_obj.get_value()
-                                else:
-                                    result_dict['value'] = segment_rule.get_value()
-                                return result_dict
-                    except Exception as err:
-                        Logger.debug(err)
-
-        result_dict['value'] = feature.get_enabled_value() if feature is not None else property_obj.get_value()
+        result_dict = _DEFAULT_RESULT.copy()
+        if feature is not None:
+            default_value = feature.get_enabled_value()
+        else:
+            default_value = property_obj.get_value()
+        for segment_rule in rules_list:
+            rule_value = segment_rule.get_value()
+            for rule in segment_rule.get_rules():
+                try:
+                    segments: list = rule.get('segments')
+                    for segment_key in segments:
+                        if self.__evaluate_segment(segment_key, entity_attributes):
+                            result_dict['evaluated_segment_id'] = segment_key
+                            if rule_value == "$default":
+                                result_dict['value'] = default_value
+                            else:
+                                result_dict['value'] = rule_value
+                            return result_dict
+                except Exception as err:
+                    Logger.debug(err)
+
+        result_dict['value'] = default_value
         return result_dict
 
     def __evaluate_segment(self, segment_key: str, entity_attributes: dict) -> bool:
-        if segment_key in self.__segment_map:
-            segment: Segment = self.__segment_map[segment_key]
+        segment: Segment = self.__segment_map.get(segment_key)
+        if segment is not None:
             return segment.evaluate_rule(entity_attributes)
         return False
 
-    def __parse_rules(self, segment_rules: List) -> dict:
-        rule_map = dict()
-        for _, rules in enumerate(segment_rules):
+    def __parse_rules(self, segment_rules: list) -> list[SegmentRules]:
+        rules_list = list()
+        for rules in segment_rules:
             try:
-                rules_obj = SegmentRules(rules)
-                rule_map[rules_obj.get_order()] = rules_obj
+                rules_list.append(SegmentRules(rules))
             except Exception as err:
                 Logger.debug(err)
-        return rule_map
+        return sorted(rules_list, key=lambda rules_obj: rules_obj.get_order())
 
     def __write_server_file(self, json: dict):
         if self.__live_config_update_enabled:
@@ -424,36 +488,72 @@ class ConfigurationHandler:
 
     def __write_to_file(self, json: dict):
         FileManager.store_files(json)
-        self.__load_configurations()
-        if self.__configuration_update_listener and callable(self.__configuration_update_listener):
+        self.__config_cache_time = FileManager.get_modified_time()
+        self.__build_maps(json)
+        if self.__configuration_update_listener is not None:
             self.__configuration_update_listener()
 
-    def __fetch_from_api(self):
-        if self.__is_initialized:
-            self.__retry_count -= 1
+    def __get_retry_delay(self, attempt: int) -> float:
+        exponent = min(attempt, self.__max_retry_exponent)
+        delay = min(self.__max_retry_interval, self.__retry_interval * 2 ** exponent)
+        return delay * random.uniform(0.5, 1.0)
+
+    def __start_timer(self, interval: float, function):
+        def run():
+            with self.__timers_lock:
+                self.__pending_timers.discard(timer)
+            function()
+
+        with self.__timers_lock:
+            if self.__is_shutdown:
+                return
+            timer = Timer(interval, run)
+            timer.daemon = True
+            self.__pending_timers.add(timer)
+        timer.start()
+
+    def __shutdown(self):
+        with self.__timers_lock:
+            self.__is_shutdown = True
+            pending_timers = self.__pending_timers
+            self.__pending_timers = set()
+        for timer in pending_timers:
+            timer.cancel()
+
+        socket = self.__socket
+        self.__socket = None
+        if socket is not None:
+            try:
+                socket.cancel()
+            except Exception as err:
+                Logger.debug(err)
 
-            response = self.__api_manager.prepare_api_request(method="GET", url=URLBuilder.get_config_url())
-            status_code = response.get_status_code()
+        Connectivity.shutdown_instance()
+        Metering.shutdown_instance()
 
-            if 200 <= status_code <= 299:
-                response_data = response.get_result()
-                try:
-                    response_data = dict(response_data)
-                    if response_data:
-                        self.__write_server_file(response_data)
-                except Exception as exception:
-                    Logger.error(f'error while while fetching {exception}')
-                    if response_data:
-                        self.__write_server_file(response_data)
-            else:
-                if self.__retry_count > 0:
-                    self.__fetch_from_api()
-                else:
-                    self.__retry_count = 3
-                    Logger.error(config_messages.CONFIGURATION_API_ERROR)
-                    timer = Timer(self.__retry_interval, self.__fetch_from_api)
-                    timer.daemon = True
-                    timer.start()
+    def __fetch_from_api(self):
+        if self.__is_initialized:
+            self.__ensure_network_stack()
+            for _ in range(self.__retry_count):
+                response = self.__api_manager.prepare_api_request(method="GET",
+                                                                  url=URLBuilder.get_config_url())
+                status_code = response.get_status_code()
+
+                if 200 <= status_code <= 299:
+                    self.__api_retry_attempt = 0
+                    response_data = response.get_result()
+                    try:
+                        response_data = dict(response_data)
+                        if response_data:
+                            self.__write_server_file(response_data)
+                    except Exception as exception:
+                        Logger.error(f'error while while fetching {exception}')
+                    return
+
+            Logger.error(config_messages.CONFIGURATION_API_ERROR)
+            delay = self.__get_retry_delay(self.__api_retry_attempt)
+            self.__start_timer(delay, self.__fetch_from_api)
+            self.__api_retry_attempt += 1
         else:
             Logger.debug(config_messages.CONFIGURATION_HANDLER_INIT_ERROR)
 
@@ -464,17 +564,18 @@ class ConfigurationHandler:
             Logger.debug(f'Received message from socket {message}')
         elif error_state:
             Logger.debug(f'Received error from socket {error_state}')
-            timer = Timer(self.__retry_interval, self.__start_web_socket)
-            timer.daemon = True
-            timer.start()
+            delay = self.__get_retry_delay(self.__socket_retry_attempt)
+            self.__start_timer(delay, self.__start_web_socket)
+            self.__socket_retry_attempt += 1
         elif closed_state:
             Logger.debug('Received close connection from socket')
             if self.__socket is not None:
                 self.__on_socket_retry = True
-                timer = Timer(self.__retry_interval, self.__start_web_socket)
-                timer.daemon = True
-                timer.start()
+                delay = self.__get_retry_delay(self.__socket_retry_attempt)
+                self.__start_timer(delay, self.__start_web_socket)
+                self.__socket_retry_attempt += 1
         elif open_state:
+            self.__socket_retry_attempt = 0
             if self.__on_socket_retry:
                 self.__on_socket_retry = False
                 self.__fetch_from_api()
@@ -23,3 +23,6 @@ DEFAULT_BASE_URL = ".apprapp.cloud.ibm.com"
 IAM_TEST_URL = "https://iam.test.cloud.ibm.com/identity/token"
 IAM_PROD_URL = "https://iam.cloud.ibm.com/identity/token"
 SDK_NAME = "appconfiguration-python-sdk"
+DEFAULT_RETRY_COUNT = 3
+DEFAULT_RETRY_INTERVAL = 600
+DEFAULT_MAX_RETRY_INTERVAL = 3600
@@ -19,6 +19,8 @@ This file defines the various messages used by the SDK.
 REGION_ERROR = "Provide a valid region in App Configuration init"
 GUID_ERROR = "Provide a valid guid in App Configuration init"
 APIKEY_ERROR = "Provide a valid apiKey in App Configuration init"
+RETRY_INTERVAL_ERROR = "Provide a positive retry_interval and a max_retry_interval " \
+                       "not less than it in App Configuration init"
 COLLECTION_ID_VALUE_ERROR = "Provide a valid collection_id in App Configuration set_context method"
 ENVIRONMENT_ID_VALUE_ERROR = "Provide a valid environment_id in App Configuration set_context method"
 COLLECTION_INIT_ERROR = "Invalid action in App Configuration. This action can be performed only after a successful " \
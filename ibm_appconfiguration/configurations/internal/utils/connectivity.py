@@ -16,7 +16,7 @@
 Package to perform the connectivity check.
 """
 
-from threading import Timer
+from threading import Timer, Lock
 import requests
 from .url_builder import URLBuilder
 
@@ -36,8 +36,25 @@ class Connectivity:
             print("Connectivity class must be initialized using the get_instance() method")
         else:
             self.__listeners = list()
+            self.__timer = None
+            self.__is_stopped = False
+            self.__lock = Lock()
             Connectivity.__instance = self
 
+    @staticmethod
+    def shutdown_instance():
+        """Stop the Connectivity checks, without creating an instance if it does not exist yet."""
+        if Connectivity.__instance is not None:
+            Connectivity.__instance.shutdown()
+
+    def shutdown(self):
+        """Cancel the repeating check_connection task."""
+        with self.__lock:
+            self.__is_stopped = True
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+
     def add_connectivity_listener(self, listener):
         """ Listener for the the internet
 
@@ -50,11 +67,13 @@ class Connectivity:
     def check_connection(self):
         """Check the connection"""
         url = URLBuilder.get_network_check_url()
-        if url:
+        if url and not self.__is_stopped:
             self.__check_network(url)
-            timer = Timer(30, self.check_connection)
-            timer.daemon = True
-            timer.start()
+            with self.__lock:
+                if not self.__is_stopped:
+                    self.__timer = Timer(30, self.check_connection)
+                    self.__timer.daemon = True
+                    self.__timer.start()
 
     def __check_network(self, url):
         try:
@@ -29,6 +29,13 @@ class FileManager:
 
     file_name = "appconfiguration.json"
 
+    @classmethod
+    def __cache_location(cls, file_path: Optional[str] = None) -> str:
+        if file_path is not None:
+            return file_path
+        this_dir, _ = os.path.split(__file__)
+        return os.path.join(this_dir, cls.file_name)
+
     @classmethod
     def store_files(cls, json_data: {}, file_path: Optional[str] = None) -> bool:
         """Store the file
@@ -37,12 +44,7 @@ class FileManager:
             json_data: Data to be stored.
             file_path: File path for the cache.
         """
-        cache_loc = ''
-        if file_path is not None:
-            cache_loc = file_path
-        else:
-            this_dir, _ = os.path.split(__file__)
-            cache_loc = os.path.join(this_dir, cls.file_name)
+        cache_loc = cls.__cache_location(file_path)
         try:
             with open(cache_loc, 'w') as cache:
                 fcntl.flock(cache, fcntl.LOCK_EX | fcntl.LOCK_NB)
@@ -63,12 +65,7 @@ class FileManager:
         Returns:
             Dictionary from the cache.
         """
-        cache_loc = ''
-        if file_path is not None:
-            cache_loc = file_path
-        else:
-            this_dir, _ = os.path.split(__file__)
-            cache_loc = os.path.join(this_dir, cls.file_name)
+        cache_loc = cls.__cache_location(file_path)
 
         try:
             with open(cache_loc, 'r') as cache:
@@ -79,3 +76,21 @@ class FileManager:
         except Exception as err:
             Logger.debug(err)
             return None
+
+    @classmethod
+    def get_modified_time(cls, file_path: Optional[str] = None) -> Optional[int]:
+        """
+        Get the last modification time of the cache.
+
+        Args:
+            file_path: File path for the cache.
+        Returns:
+            Modification time of the cache in nanoseconds, `None` if the cache is not available.
+        """
+        cache_loc = cls.__cache_location(file_path)
+
+        try:
+            return os.stat(cache_loc).st_mtime_ns
+        except OSError as err:
+            Logger.debug(err)
+            return None
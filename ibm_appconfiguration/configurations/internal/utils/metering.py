@@ -15,16 +15,32 @@
 """
 This module provides methods that perform metering and usage related operations.
 """
-from threading import Lock, Timer
+import weakref
+from threading import Lock, Timer, local
+from collections import deque
 from datetime import datetime
 from .api_manager import APIManager
 from .logger import Logger
 from ..common import config_messages
 
 
+class _BufferOwner:
+    """Thread-local owner of a metering buffer.
+
+    It is released together with the thread-local data when its thread exits, which
+    also covers threads not started through the threading module, whose dummy
+    Thread objects report themselves alive forever.
+    """
+    __slots__ = ('buffer', '__weakref__')
+
+    def __init__(self, buffer: deque):
+        self.buffer = buffer
+
+
 class Metering:
     """Class to send the metering data."""
     __send_interval = 600
+    __flush_size = 50
     __instance = None
 
     @staticmethod
@@ -41,7 +57,11 @@ class Metering:
         self.__metering_url = None
         self.__apikey = None
         self.__repeating = True
+        self.__is_stopped = False
+        self.__timer = None
         self.__lock = Lock()
+        self.__local = local()
+        self.__buffers = list()
         self.__metering_feature_data = dict()
         self.__metering_property_data = dict()
         Metering.__instance = self
@@ -80,73 +100,107 @@ class Metering:
             feature_id: Id of the Feature.
             property_id: Id of the Property.
         """
+        owner = getattr(self.__local, 'owner', None)
+        if owner is None:
+            owner = _BufferOwner(deque())
+            self.__local.owner = owner
+            self.__lock.acquire()
+            try:
+                self.__buffers.append((weakref.ref(owner), owner.buffer))
+            finally:
+                self.__lock.release()
+        buffer = owner.buffer
+
+        buffer.append((guid, environment_id, collection_id, entity_id, segment_id,
+                       feature_id, property_id,
+                       datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")))
+        if len(buffer) >= self.__flush_size:
+            self.flush()
 
+    def flush(self):
+        """Move the buffered metering values of all the threads into the metering data."""
         self.__lock.acquire()
         try:
-            time = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-            feature_json = {
-                'count': 1,
-                'evaluation_time': time
-            }
+            alive_buffers = list()
+            for owner, buffer in self.__buffers:
+                # check before draining, a thread that is gone cannot append anymore
+                is_alive = owner() is not None
+                while buffer:
+                    self.__record_metering(*buffer.popleft())
+                if is_alive:
+                    alive_buffers.append((owner, buffer))
+            self.__buffers = alive_buffers
+        finally:
+            self.__lock.release()
+
+    def __record_metering(self, guid: str, environment_id: str,
+                          collection_id: str, entity_id: str,
+                          segment_id: str, feature_id: str,
+                          property_id: str, time: str):
+        feature_json = {
+            'count': 1,
+            'evaluation_time': time
+        }
 
-            modify_metering_data = self.__metering_feature_data if property_id is None else self.__metering_property_data
-            modify_id = feature_id if property_id is None else property_id
-
-            if guid in modify_metering_data:
-                if environment_id in modify_metering_data[guid]:
-                    if collection_id in modify_metering_data[guid][environment_id]:
-                        if modify_id in modify_metering_data[guid][environment_id][collection_id]:
-                            if entity_id in modify_metering_data[guid][environment_id][collection_id][modify_id]:
-                                if segment_id in modify_metering_data[guid][environment_id][collection_id][modify_id][entity_id]:
-                                    modify_metering_data[guid][environment_id][collection_id][modify_id][entity_id][segment_id]['evaluation_time'] = time
-                                    count = modify_metering_data[guid][environment_id][collection_id][modify_id][entity_id][segment_id]['count']
-                                    modify_metering_data[guid][environment_id][collection_id][modify_id][entity_id][segment_id]['count'] = count + 1
-                                else:
-                                    modify_metering_data[guid][environment_id][collection_id][modify_id][entity_id][segment_id] = feature_json
+        modify_metering_data = self.__metering_feature_data if property_id is None else self.__metering_property_data
+        modify_id = feature_id if property_id is None else property_id
+
+        if guid in modify_metering_data:
+            if environment_id in modify_metering_data[guid]:
+                if collection_id in modify_metering_data[guid][environment_id]:
+                    if modify_id in modify_metering_data[guid][environment_id][collection_id]:
+                        if entity_id in modify_metering_data[guid][environment_id][collection_id][modify_id]:
+                            if segment_id in modify_metering_data[guid][environment_id][collection_id][modify_id][entity_id]:
+                                modify_metering_data[guid][environment_id][collection_id][modify_id][entity_id][segment_id]['evaluation_time'] = time
+                                count = modify_metering_data[guid][environment_id][collection_id][modify_id][entity_id][segment_id]['count']
+                                modify_metering_data[guid][environment_id][collection_id][modify_id][entity_id][segment_id]['count'] = count + 1
                             else:
-                                modify_metering_data[guid][environment_id][collection_id][modify_id][entity_id] = {
-                                    segment_id: feature_json
-                                }
+                                modify_metering_data[guid][environment_id][collection_id][modify_id][entity_id][segment_id] = feature_json
                         else:
-                            modify_metering_data[guid][environment_id][collection_id][modify_id] = {
-                                entity_id: {
-                                    segment_id: feature_json
-                                }
+                            modify_metering_data[guid][environment_id][collection_id][modify_id][entity_id] = {
+                                segment_id: feature_json
                             }
                     else:
-                        modify_metering_data[guid][environment_id][collection_id] = {
-                            modify_id: {
-                                entity_id: {
-                                    segment_id: feature_json
-                                }
+                        modify_metering_data[guid][environment_id][collection_id][modify_id] = {
+                            entity_id: {
+                                segment_id: feature_json
                             }
                         }
                 else:
-                    modify_metering_data[guid][environment_id] = {
-                        collection_id: {
-                            modify_id: {
-                                entity_id: {
-                                    segment_id: feature_json
-                                }
+                    modify_metering_data[guid][environment_id][collection_id] = {
+                        modify_id: {
+                            entity_id: {
+                                segment_id: feature_json
                             }
                         }
                     }
             else:
-                modify_metering_data[guid] = {
-                    environment_id: {
-                        collection_id: {
-                            modify_id: {
-                                entity_id: {
-                                    segment_id: feature_json
-                                }
+                modify_metering_data[guid][environment_id] = {
+                    collection_id: {
+                        modify_id: {
+                            entity_id: {
+                                segment_id: feature_json
                             }
                         }
                     }
                 }
-        finally:
-            self.__lock.release()
+        else:
+            modify_metering_data[guid] = {
+                environment_id: {
+                    collection_id: {
+                        modify_id: {
+                            entity_id: {
+                                segment_id: feature_json
+                            }
+                        }
+                    }
+                }
+            }
 
     def __send_to_server(self, guid, data):
+        if self.__metering_url is None:
+            Logger.debug("Metering url is not set, skipping the metering data")
+            return
         if self.__repeating:
             api_manager = APIManager.get_instance()
             api_manager.setup_base()
@@ -184,11 +238,36 @@ class Metering:
 
     def send_metering(self):
         """Send the metering."""
-        if self.__repeating:
-            timer = Timer(self.__send_interval, self.send_metering)
-            timer.daemon = True
-            timer.start()
+        self.__lock.acquire()
+        try:
+            if self.__repeating and not self.__is_stopped:
+                self.__timer = Timer(self.__send_interval, self.send_metering)
+                self.__timer.daemon = True
+                self.__timer.start()
+        finally:
+            self.__lock.release()
+        return self.__send_pending_metering()
+
+    @staticmethod
+    def shutdown_instance():
+        """Shut down the Metering instance, without creating one if it does not exist yet."""
+        if Metering.__instance is not None:
+            Metering.__instance.shutdown()
+
+    def shutdown(self):
+        """Stop the repeating send_metering task and send the pending metering data."""
+        self.__lock.acquire()
+        try:
+            self.__is_stopped = True
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+        finally:
+            self.__lock.release()
+        return self.__send_pending_metering()
 
+    def __send_pending_metering(self):
+        self.flush()
         self.__lock.acquire()
         try:
             send_feature_data = self.__metering_feature_data
@@ -15,6 +15,9 @@
 """
 This module provides methods to perform the input validations.
 """
+import math
+
+
 class Validators:
     """Validator class"""
     @classmethod
@@ -25,3 +28,13 @@ class Validators:
             value: value to be checked
         """
         return bool(value and value.strip())
+
+    @classmethod
+    def validate_number(cls, value) -> bool:
+        """Validate the number
+
+        Args:
+            value: value to be checked
+        """
+        return isinstance(value, (int, float)) and not isinstance(value, bool) \
+            and math.isfinite(value)
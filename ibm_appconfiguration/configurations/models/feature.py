@@ -23,6 +23,8 @@ from .configuration_type import ConfigurationType
 
 class Feature:
     """Feature object"""
+    __slots__ = ('__enabled', '__name', '__feature_id', '__segment_rules', '__feature_data',
+                 '__type', '__disabled_value', '__enabled_value')
 
     def __init__(self, feature_list=dict):
         """
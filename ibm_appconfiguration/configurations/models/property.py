@@ -23,6 +23,8 @@ from .configuration_type import ConfigurationType
 
 class Property:
     """Property object"""
+    __slots__ = ('__name', '__property_id', '__segment_rules', '__property_data', '__type',
+                 '__value')
     def __init__(self, property_list=dict):
         """
         @type property_list: dict
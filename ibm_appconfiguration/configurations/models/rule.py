@@ -24,11 +24,13 @@ class Rule:
         Attributes:
            rules (dict): rules JSON object that contains all the Rules.
     """
+    __slots__ = ('__attribute_name', '__operator', '__values', '__operator_function')
 
     def __init__(self, rules: {}):
         self.__attribute_name = rules.get("attribute_name", "")
         self.__operator = rules.get("operator", "")
         self.__values = rules.get("values", list())
+        self.__operator_function = Rule.__operators.get(self.__operator, False)
 
     def get_attributes(self) -> str:
         """Get the Rule attributes"""
@@ -91,6 +93,17 @@ class Rule:
             return key_obj[1] <= value_obj[1]
         return False
 
+    __operators = {
+        "endsWith": __ends_with,
+        "startsWith": __starts_with,
+        "contains": __contains,
+        "is": __is,
+        "greaterThan": __greater_than,
+        "lesserThan": __lesser_than,
+        "greaterThanEquals": __greater_than_equals,
+        "lesserThanEquals": __lesser_than_equals
+    }
+
     def __operator_check(self, key_data=None, value_data=None) -> bool:
         key = key_data
         value = value_data
@@ -100,17 +113,7 @@ class Rule:
         if key is None or value is None:
             return result
 
-        case_checker = {
-            "endsWith": self.__ends_with,
-            "startsWith": self.__starts_with,
-            "contains": self.__contains,
-            "is": self.__is,
-            "greaterThan": self.__greater_than,
-            "lesserThan": self.__lesser_than,
-            "greaterThanEquals": self.__greater_than_equals,
-            "lesserThanEquals": self.__lesser_than_equals
-        }
-        return case_checker.get(self.__operator, False)(key, value)
+        return self.__operator_function(self, key, value)
 
     def __number_conversion(self, value) -> Tuple[bool, float]:
         if isinstance(value, bool):
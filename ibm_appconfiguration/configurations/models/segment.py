@@ -25,11 +25,18 @@ class Segment:
       Attributes:
          segment_rules (dict): segments JSON object that contains all the Segments
    """
+    __slots__ = ('__name', '__segment_id', '__rules', '__rule_objects')
 
     def __init__(self, segments: {}):
         self.__name = segments.get("name", "")
         self.__segment_id = segments.get("segment_id", "")
         self.__rules = segments.get("rules", list())
+        self.__rule_objects = list()
+        for rule in self.__rules:
+            try:
+                self.__rule_objects.append(Rule(rule))
+            except Exception as exception:
+                Logger.debug(f'Invalid rule in Segment class, {exception}')
 
     def get_name(self) -> str:
         """Get the Segment name"""
@@ -49,11 +56,8 @@ class Segment:
         Args:
             entity_attributes: Entity attributes object
         """
-        for index in range(0, len(self.__rules)):
+        for rule in self.__rule_objects:
             try:
-                dict_sec = self.__rules[index]
-                rule = Rule(dict_sec)
-
                 if not rule.evaluate_rule(entity_attributes):
                     return False
             except Exception as exception:
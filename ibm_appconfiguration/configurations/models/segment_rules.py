@@ -20,6 +20,7 @@ class SegmentRules:
        Attributes:
         segment_rules (dict): segment_rules JSON object that contains all the SegmentRules
    """
+    __slots__ = ('__order', '__value', '__rules')
 
     def __init__(self, segment_rules: {}):
 
@@ -49,5 +49,5 @@ setup(
         "Intended Audience :: Developers",
         "Programming Language :: Python :: 3"
     ],
-    python_requires='>=3.0'
+    python_requires='>=3.7'
 )
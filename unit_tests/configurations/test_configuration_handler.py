@@ -15,11 +15,14 @@
 import unittest
 import os
 import time
+from unittest import mock
 import responses
 from ibm_appconfiguration import Property, Feature
 from ibm_appconfiguration.configurations.configuration_handler import ConfigurationHandler
 from ibm_appconfiguration.configurations.internal.utils.metering import Metering
+from ibm_appconfiguration.configurations.internal.utils.file_manager import FileManager
 from ibm_appconfiguration.configurations.internal.utils.url_builder import URLBuilder
+from ibm_appconfiguration.configurations.internal.utils.connectivity import Connectivity
 
 
 class MyTestCase(unittest.TestCase):
@@ -80,9 +83,124 @@ class MyTestCase(unittest.TestCase):
                            status=200)
         self.sut.init("apikey", "guid", "region", "https://cloud.ibm.com")
         self.sut.set_context("collection_id", "environment_id", None, True)
+        self.sut._ConfigurationHandler__api_retry_attempt = 5
         self.sut.load_data()
         features = self.sut.get_features()
         self.assertEqual(len(features), 1)
+        self.assertEqual(self.sut._ConfigurationHandler__api_retry_attempt, 0)
+
+    def test_retry_delay(self):
+        self.sut.init("apikey", "guid", "region", None, retry_interval=0.5, max_retry_interval=4)
+        get_retry_delay = self.sut._ConfigurationHandler__get_retry_delay
+        for attempt, delay in [(0, 0.5), (1, 1), (2, 2), (3, 4), (4, 4), (1100, 4)]:
+            for _ in range(20):
+                value = get_retry_delay(attempt)
+                self.assertGreaterEqual(value, delay * 0.5)
+                self.assertLessEqual(value, delay)
+
+    def test_fetch_retries_then_backs_off(self):
+        Metering.get_instance().set_repeat_calls(False)
+        URLBuilder.set_auth_type(False)
+        url = 'https://cloud.ibm.com/apprapp/feature/v1/instances/guid/collections/collection_id/config?environment_id=environment_id'
+        self.responses.add(responses.GET, url, status=500)
+        self.sut.init("apikey", "guid", "region", "https://cloud.ibm.com",
+                      retry_interval=2, max_retry_interval=8)
+        self.sut.set_context("collection_id", "environment_id", None, False)
+        with mock.patch.object(self.sut, '_ConfigurationHandler__start_timer') as start_timer:
+            self.sut._ConfigurationHandler__fetch_from_api()
+        self.assertEqual(len(self.responses.calls), 3)
+        start_timer.assert_called_once()
+        delay, function = start_timer.call_args[0]
+        self.assertGreaterEqual(delay, 1)
+        self.assertLessEqual(delay, 2)
+        self.assertEqual(function, self.sut._ConfigurationHandler__fetch_from_api)
+        self.assertEqual(self.sut._ConfigurationHandler__api_retry_attempt, 1)
+
+    def test_fetch_stops_retrying_on_success(self):
+        Metering.get_instance().set_repeat_calls(False)
+        URLBuilder.set_auth_type(False)
+        url = 'https://cloud.ibm.com/apprapp/feature/v1/instances/guid/collections/collection_id/config?environment_id=environment_id'
+        self.responses.add(responses.GET, url, status=500)
+        self.responses.add(responses.GET, url, json={"features": [], "properties": [], "segments": []},
+                           status=200)
+        self.sut.init("apikey", "guid", "region", "https://cloud.ibm.com")
+        self.sut.set_context("collection_id", "environment_id", None, False)
+        with mock.patch.object(self.sut, '_ConfigurationHandler__start_timer') as start_timer:
+            self.sut._ConfigurationHandler__fetch_from_api()
+        self.assertEqual(len(self.responses.calls), 2)
+        start_timer.assert_not_called()
+
+    def test_offline_mode_skips_network_stack(self):
+        this_dir, _ = os.path.split(__file__)
+        with mock.patch.object(URLBuilder, 'init_with_collection_id') as init_with_collection_id, \
+                mock.patch.object(Connectivity, 'get_instance') as get_instance:
+            self.sut.set_context("collectionId", "environmentId", os.path.join(this_dir, 'user.json'),
+                                 False)
+            self.sut.load_data()
+        init_with_collection_id.assert_not_called()
+        get_instance.assert_not_called()
+
+    def test_network_stack_built_once(self):
+        Metering.get_instance().set_repeat_calls(False)
+        URLBuilder.set_auth_type(False)
+        url = 'https://cloud.ibm.com/apprapp/feature/v1/instances/guid/collections/collection_id/config?environment_id=environment_id'
+        self.responses.add(responses.GET, url, json={"features": [], "properties": [], "segments": []},
+                           status=200)
+        self.sut.init("apikey", "guid", "region", "https://cloud.ibm.com")
+        self.sut.set_context("collection_id", "environment_id", None, False)
+        with mock.patch.object(URLBuilder, 'init_with_collection_id',
+                               wraps=URLBuilder.init_with_collection_id) as init_with_collection_id:
+            self.sut._ConfigurationHandler__fetch_from_api()
+            self.sut._ConfigurationHandler__fetch_from_api()
+        init_with_collection_id.assert_called_once()
+
+    def test_retry_attempt_reset(self):
+        self.sut._ConfigurationHandler__socket_retry_attempt = 5
+        self.sut._ConfigurationHandler__on_web_socket_callback(open_state='Opened the web_socket')
+        self.assertEqual(self.sut._ConfigurationHandler__socket_retry_attempt, 0)
+
+    def test_shutdown_without_metering(self):
+        self.addCleanup(setattr, self.sut, '_ConfigurationHandler__is_shutdown', False)
+        with mock.patch.object(Metering, '_Metering__instance', None), \
+                mock.patch.object(Connectivity, '_Connectivity__instance', None), \
+                mock.patch('ibm_appconfiguration.configurations.internal.utils.metering.Timer') \
+                as timer:
+            self.sut._ConfigurationHandler__shutdown()
+            self.assertIsNone(Metering._Metering__instance)
+            timer.assert_not_called()
+
+    def test_shutdown_cancels_pending_timers(self):
+        self.addCleanup(setattr, self.sut, '_ConfigurationHandler__is_shutdown', False)
+        retry = mock.Mock()
+        with mock.patch.object(Metering, 'shutdown_instance'), \
+                mock.patch.object(Connectivity, 'shutdown_instance') as shutdown_connectivity:
+            pending_timers = set(self.sut._ConfigurationHandler__pending_timers)
+            self.sut._ConfigurationHandler__start_timer(60, retry)
+            timers = self.sut._ConfigurationHandler__pending_timers - pending_timers
+            self.assertEqual(len(timers), 1)
+            self.sut._ConfigurationHandler__shutdown()
+            shutdown_connectivity.assert_called_once()
+        timer = timers.pop()
+        self.assertTrue(timer.finished.is_set())
+        timer.join(1)
+        self.assertFalse(timer.is_alive())
+        self.assertEqual(len(self.sut._ConfigurationHandler__pending_timers), 0)
+        self.sut._ConfigurationHandler__start_timer(0, retry)
+        self.assertEqual(len(self.sut._ConfigurationHandler__pending_timers), 0)
+        retry.assert_not_called()
+
+    def test_invalid_entry_is_skipped(self):
+        config = {
+            "features": [
+                {"name": "a", "feature_id": "a", "type": "STRING", "enabled": True},
+                {"name": "b", "feature_id": "b", "type": "JSON", "enabled": True},
+                {"name": "c", "feature_id": "c", "type": "STRING", "enabled": True}
+            ],
+            "properties": [],
+            "segments": []
+        }
+        self.sut._ConfigurationHandler__write_to_file(config)
+        self.assertEqual(sorted(self.sut.get_features()), ['a', 'c'])
 
     def test_evaluate_property(self):
         property_json = {
@@ -119,6 +237,46 @@ class MyTestCase(unittest.TestCase):
         value = self.sut.property_evaluation(property_obj, "id1", {})
         self.assertEqual(value, 10)
 
+    def test_evaluate_feature_rules_order(self):
+        feature_json = {
+            "name": "orderedFeature",
+            "feature_id": "orderedfeature",
+            "type": "STRING",
+            "enabled_value": "hello",
+            "disabled_value": "Bye",
+            "segment_rules": [
+                {
+                    "rules": [
+                        {
+                            "segments": [
+                                "kfw38i6s"
+                            ]
+                        }
+                    ],
+                    "value": "Tester",
+                    "order": 5
+                },
+                {
+                    "rules": [
+                        {
+                            "segments": [
+                                "kg92d3wa"
+                            ]
+                        }
+                    ],
+                    "value": "Welcome",
+                    "order": 2
+                }
+            ],
+            "enabled": True
+        }
+        feature_obj = Feature(feature_json)
+        value = self.sut.feature_evaluation(feature_obj, "id1", {"email": "test.dev@tester.com"})
+        self.assertEqual(value, "Welcome")
+
+        value = self.sut.feature_evaluation(feature_obj, "id1", {"email": "test@tester.com"})
+        self.assertEqual(value, "Tester")
+
     def test_evaluate_feature(self):
         feature_json = {
             "name": "defaultFeature",
@@ -165,6 +323,34 @@ class MyTestCase(unittest.TestCase):
         properties = self.sut.get_properties()
         self.assertEqual(len(properties), 1)
 
+    def test_get_missing_methods(self):
+        self.assertIsNone(self.sut.get_feature("missingfeature"))
+        self.assertIsNone(self.sut.get_property("missingproperty"))
+
+        with mock.patch.object(FileManager, 'get_modified_time',
+                               wraps=FileManager.get_modified_time) as get_modified_time, \
+                mock.patch.object(FileManager, 'read_files',
+                                  wraps=FileManager.read_files) as read_files:
+            for _ in range(2):
+                self.assertIsNone(self.sut.get_feature("missingfeature"))
+                self.assertIsNone(self.sut.get_property("missingproperty"))
+            get_modified_time.assert_not_called()
+            read_files.assert_not_called()
+
+        this_dir, _ = os.path.split(__file__)
+        config = FileManager.read_files(os.path.join(this_dir, 'user.json'))
+        config['features'].append({
+            "name": "missingFeature",
+            "feature_id": "missingfeature",
+            "type": "STRING",
+            "enabled_value": "hello",
+            "disabled_value": "Bye",
+            "segment_rules": [],
+            "enabled": True
+        })
+        self.sut._ConfigurationHandler__write_to_file(config)
+        self.assertEqual(self.sut.get_feature("missingfeature").get_feature_id(), "missingfeature")
+        self.assertEqual(self.sut.get_feature("defaultfeature").get_feature_id(), "defaultfeature")
 
 if __name__ == '__main__':
     unittest.main()
@@ -76,6 +76,11 @@ class MyTestCase(unittest.TestCase):
 
         self.assertIsNotNone(expected_data)
 
+    def test_file_modified_time(self):
+        self.assertEqual(FileManager.get_modified_time(self.file_path),
+                         os.stat(self.file_path).st_mtime_ns)
+        self.assertIsNone(FileManager.get_modified_time(self.file_path + '.missing'))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -13,6 +13,10 @@
 # limitations under the License.
 
 import unittest
+import time
+import _thread
+from threading import Thread, Event
+from unittest import mock
 from ibm_appconfiguration.configurations.internal.utils.metering import Metering
 
 
@@ -57,6 +61,65 @@ class MyTestCase(unittest.TestCase):
         # print(result)
         self.assertEqual(len(result["guid1"]), 4)
 
+    def test_metering_from_threads(self):
+
+        metering = Metering.get_instance()
+        metering.set_repeat_calls(False)
+
+        def evaluate():
+            for _ in range(120):
+                metering.add_metering(guid="guid2", environment_id="environment_id1",
+                                      collection_id="collection_id1", entity_id="id_1",
+                                      segment_id="segment_id1", feature_id='feature_id1')
+
+        threads = [Thread(target=evaluate) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        result = metering.send_metering()
+        self.assertEqual(len(result["guid2"]), 1)
+        self.assertEqual(result["guid2"][0]['usages'][0]['count'], 360)
+
+    def test_metering_buffer_pruned_after_foreign_thread(self):
+
+        metering = Metering.get_instance()
+        metering.set_repeat_calls(False)
+        metering.send_metering()
+        buffer_count = len(metering._Metering__buffers)
+        done = Event()
+
+        def evaluate():
+            metering.add_metering(guid="guid3", environment_id="environment_id1",
+                                  collection_id="collection_id1", entity_id="id_1",
+                                  segment_id="segment_id1", feature_id='feature_id1')
+            done.set()
+
+        _thread.start_new_thread(evaluate, ())
+        self.assertTrue(done.wait(5))
+        deadline = time.time() + 5
+        while len(metering._Metering__buffers) > buffer_count and time.time() < deadline:
+            metering.flush()
+            time.sleep(0.05)
+        self.assertEqual(len(metering._Metering__buffers), buffer_count)
+
+        result = metering.send_metering()
+        self.assertEqual(result["guid3"][0]['usages'][0]['count'], 1)
+
+    def test_metering_shutdown_stops_repeating(self):
+
+        with mock.patch.object(Metering, '_Metering__instance', None), \
+                mock.patch('ibm_appconfiguration.configurations.internal.utils.metering.Timer') \
+                as timer:
+            metering = Metering()
+            timer.assert_called_once()
+            metering.shutdown()
+            timer.return_value.cancel.assert_called_once()
+            timer.reset_mock()
+            metering.send_metering()
+            timer.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()
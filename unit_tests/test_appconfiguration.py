@@ -15,6 +15,8 @@
 import time
 import unittest
 import os
+from threading import Event
+from unittest import mock
 from ibm_appconfiguration import AppConfiguration
 from ibm_appconfiguration.configurations.internal.utils.url_builder import URLBuilder
 
@@ -45,6 +47,18 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(sut1.get_apikey(), "apikey_value")
         self.assertEqual(sut1.get_region(), "us-south")
 
+        sut1.init('eu-gb', "guid_value", "apikey_value", retry_interval=0)
+        self.assertEqual(sut1.get_region(), "us-south")
+
+        sut1.init('eu-gb', "guid_value", "apikey_value", retry_interval=60, max_retry_interval=30)
+        self.assertEqual(sut1.get_region(), "us-south")
+
+        sut1.init('eu-gb', "guid_value", "apikey_value", retry_interval="60")
+        self.assertEqual(sut1.get_region(), "us-south")
+
+        sut1.init('eu-gb', "guid_value", "apikey_value", max_retry_interval=None)
+        self.assertEqual(sut1.get_region(), "us-south")
+
     def test_configuration_fetch(self):
         sut1 = AppConfiguration.get_instance()
         sut1.set_context("", "")
@@ -77,6 +91,50 @@ class MyTestCase(unittest.TestCase):
 
         self.assertEqual(len(sut1.get_features()), 3)
 
+    def wait_for_loader(self, sut):
+        sut._AppConfiguration__loader.submit(lambda: None).result(5)
+
+    def test_configuration_fetch_while_loading(self):
+        sut1 = AppConfiguration.get_instance()
+        sut1.init('us-south', "guid_value", "apikey_value")
+        this_dir, _ = os.path.split(__file__)
+        sut1.set_context("collectionId", "environmentId", os.path.join(this_dir, 'user.json'),
+                         False)
+        self.wait_for_loader(sut1)
+
+        started = Event()
+        release = Event()
+
+        def load_data():
+            started.set()
+            release.wait(5)
+
+        handler = sut1._AppConfiguration__configuration_handler_instance
+        with mock.patch.object(handler, 'load_data', side_effect=load_data) as load:
+            sut1.fetch_configurations()
+            self.assertTrue(started.wait(5))
+            sut1.fetch_configurations()
+            sut1.fetch_configurations()
+            sut1._AppConfiguration__load_data_now()
+            release.set()
+            self.wait_for_loader(sut1)
+            self.assertEqual(load.call_count, 1)
+
+    def test_configuration_fetch_error_logged(self):
+        sut1 = AppConfiguration.get_instance()
+        sut1.init('us-south', "guid_value", "apikey_value")
+        this_dir, _ = os.path.split(__file__)
+        sut1.set_context("collectionId", "environmentId", os.path.join(this_dir, 'user.json'),
+                         False)
+        self.wait_for_loader(sut1)
+
+        handler = sut1._AppConfiguration__configuration_handler_instance
+        with mock.patch.object(handler, 'load_data', side_effect=ValueError('broken')), \
+                mock.patch('ibm_appconfiguration.appconfiguration.Logger.error') as error:
+            sut1.fetch_configurations()
+            self.wait_for_loader(sut1)
+            error.assert_called_once_with('Error while loading the configurations broken')
+
     def test_configuration_get_features_Dict(self):
         sut1 = AppConfiguration.get_instance()
         self.assertIsNotNone(sut1.get_features())